@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -8,21 +9,33 @@ class Settings(BaseSettings):
     # Companion Docker configuration
     companion_docker_path: str = "/opt/companion-docker"
     companion_container_name: str = "companion"
+    docker_socket: str = "/var/run/docker.sock"
 
     # GitHub configuration
     github_repo: str = "bitfocus/companion"
     github_api_base: str = "https://api.github.com"
+    # Optional token to raise the API rate limit from 60/hr to 5000/hr
+    github_token: Optional[str] = None
 
     # Rate limiting (seconds between updates)
     update_cooldown: int = 300  # 5 minutes
+    # Updates allowed back-to-back before the cooldown applies
+    update_burst: int = 2
+    # Longest an update may run before its commands are terminated (seconds)
+    update_timeout: int = 1800  # 30 minutes
 
     # Cache TTL for GitHub API (seconds)
     github_cache_ttl: int = 60  # 1 minute
 
     class Config:
         env_prefix = ""
+        frozen = True
 
 
 @lru_cache
 def get_settings() -> Settings:
     return Settings()
+
+
+# Process-wide settings, loaded once at import
+SETTINGS = get_settings()
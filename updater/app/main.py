@@ -1,14 +1,21 @@
 import asyncio
+import gzip
+import hashlib
 import logging
+import time
 from datetime import datetime
-from typing import AsyncGenerator
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Optional
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, Response
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-from .config import get_settings
-from .services.docker_ops import docker_ops
+from .config import SETTINGS
+from .services.docker_ops import get_docker_ops
+from .services.events import KEEPALIVE_FRAME, update_events
 from .services.github import github_client
 from .services.version import is_update_available, format_version
 
@@ -25,14 +32,51 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Store update state
-update_in_progress = False
+# Static assets are referenced by content hash, so they never go stale
+STATIC_DIR = Path(__file__).parent / "static"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """Static files served with far-future cache headers."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+def asset_url(name: str) -> str:
+    """Build a cache-busting URL for a static asset."""
+    digest = hashlib.md5((STATIC_DIR / name).read_bytes()).hexdigest()[:12]
+    return f"/static/{name}?v={digest}"
+
+
+app.mount("/static", ImmutableStaticFiles(directory=STATIC_DIR), name="static")
+
+# Held while an update runs; checked without blocking to reject overlaps
+update_lock = asyncio.Lock()
+
+# Background task running the current update, independent of any client
+_update_task: Optional[asyncio.Task] = None
+
+# Update stream keep-alive interval (seconds)
+UPDATE_STREAM_KEEPALIVE = 15
+
+# Status stream timing (seconds)
+STATUS_STREAM_INTERVAL = 5
+STATUS_STREAM_KEEPALIVE = 21
+
+# Short-lived status cache shared by all clients
+STATUS_CACHE_TTL = 3
+_status_cache: Dict[str, Any] = {"data": None, "ts": 0.0}
+_status_lock = asyncio.Lock()
 
 
 class StatusResponse(BaseModel):
     """Response model for status endpoint."""
     current_version: str
     latest_version: str
+    latest_stale: bool = False
     update_available: bool
     container_status: str
     container_running: bool
@@ -47,7 +91,7 @@ class UpdateResponse(BaseModel):
     message: str
 
 
-# HTML Template
+# HTML Template (styles and scripts live in app/static)
 DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
@@ -55,242 +99,7 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Companion Update Dashboard</title>
-    <style>
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            color: #e0e0e0;
-            padding: 2rem;
-        }
-
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-        }
-
-        header {
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-
-        h1 {
-            font-size: 2rem;
-            color: #fff;
-            margin-bottom: 0.5rem;
-        }
-
-        .subtitle {
-            color: #888;
-            font-size: 0.9rem;
-        }
-
-        .card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .version-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 1rem;
-            margin-bottom: 1rem;
-        }
-
-        .version-box {
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: 8px;
-            padding: 1rem;
-            text-align: center;
-        }
-
-        .version-label {
-            font-size: 0.8rem;
-            color: #888;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 0.5rem;
-        }
-
-        .version-number {
-            font-size: 1.8rem;
-            font-weight: bold;
-            color: #fff;
-        }
-
-        .version-number.current {
-            color: #4ecdc4;
-        }
-
-        .version-number.latest {
-            color: #ff6b6b;
-        }
-
-        .version-number.up-to-date {
-            color: #4ecdc4;
-        }
-
-        .status-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 0.75rem 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }
-
-        .status-row:last-child {
-            border-bottom: none;
-        }
-
-        .status-label {
-            color: #888;
-        }
-
-        .status-value {
-            font-weight: 500;
-        }
-
-        .status-badge {
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.85rem;
-            font-weight: 500;
-        }
-
-        .badge-running {
-            background: rgba(78, 205, 196, 0.2);
-            color: #4ecdc4;
-        }
-
-        .badge-stopped {
-            background: rgba(255, 107, 107, 0.2);
-            color: #ff6b6b;
-        }
-
-        .badge-update {
-            background: rgba(255, 193, 7, 0.2);
-            color: #ffc107;
-        }
-
-        .badge-current {
-            background: rgba(78, 205, 196, 0.2);
-            color: #4ecdc4;
-        }
-
-        .update-btn {
-            width: 100%;
-            padding: 1rem;
-            font-size: 1.1rem;
-            font-weight: 600;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-
-        .update-btn.available {
-            background: linear-gradient(135deg, #ff6b6b 0%, #ee5a5a 100%);
-            color: white;
-        }
-
-        .update-btn.available:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
-        }
-
-        .update-btn.disabled {
-            background: #333;
-            color: #666;
-            cursor: not-allowed;
-        }
-
-        .update-btn.in-progress {
-            background: #444;
-            color: #888;
-            cursor: wait;
-        }
-
-        .progress-container {
-            display: none;
-            margin-top: 1rem;
-        }
-
-        .progress-container.active {
-            display: block;
-        }
-
-        .progress-log {
-            background: #000;
-            border-radius: 8px;
-            padding: 1rem;
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-size: 0.85rem;
-            max-height: 300px;
-            overflow-y: auto;
-            line-height: 1.6;
-        }
-
-        .progress-log .line {
-            color: #4ecdc4;
-        }
-
-        .progress-log .error {
-            color: #ff6b6b;
-        }
-
-        .progress-log .success {
-            color: #4ecdc4;
-            font-weight: bold;
-        }
-
-        .refresh-btn {
-            background: transparent;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            color: #888;
-            padding: 0.5rem 1rem;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 0.85rem;
-            transition: all 0.2s ease;
-        }
-
-        .refresh-btn:hover {
-            border-color: rgba(255, 255, 255, 0.4);
-            color: #fff;
-        }
-
-        .footer {
-            text-align: center;
-            margin-top: 2rem;
-            color: #555;
-            font-size: 0.8rem;
-        }
-
-        .loading {
-            opacity: 0.5;
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-
-        .updating {
-            animation: pulse 1.5s infinite;
-        }
-    </style>
+    <link rel="stylesheet" href="{css_url}">
 </head>
 <body>
     <div class="container">
@@ -346,257 +155,248 @@ DASHBOARD_HTML = """
         </footer>
     </div>
 
-    <script>
-        let updateInProgress = false;
-
-        async function checkStatus() {
-            const btn = document.getElementById('update-btn');
-            const refreshBtn = document.getElementById('refresh-btn');
-
-            if (updateInProgress) return;
-
-            refreshBtn.disabled = true;
-            refreshBtn.textContent = 'Checking...';
-
-            try {
-                const response = await fetch('/api/status');
-                const data = await response.json();
-
-                // Update version displays
-                document.getElementById('current-version').textContent = data.current_version;
-
-                const latestEl = document.getElementById('latest-version');
-                latestEl.textContent = data.latest_version;
-                latestEl.className = 'version-number ' + (data.update_available ? 'latest' : 'up-to-date');
-
-                // Update container status
-                const containerStatus = document.getElementById('container-status');
-                containerStatus.textContent = data.container_status;
-                containerStatus.className = 'status-badge ' + (data.container_running ? 'badge-running' : 'badge-stopped');
-
-                // Update update status
-                const updateStatus = document.getElementById('update-status');
-                if (data.update_available) {
-                    updateStatus.textContent = 'Update Available';
-                    updateStatus.className = 'status-badge badge-update';
-                } else {
-                    updateStatus.textContent = 'Up to Date';
-                    updateStatus.className = 'status-badge badge-current';
-                }
-
-                // Update last checked
-                document.getElementById('last-checked').textContent = data.last_checked;
-
-                // Update button state
-                if (data.update_available && data.can_update) {
-                    btn.textContent = 'Update Now';
-                    btn.className = 'update-btn available';
-                    btn.disabled = false;
-                } else if (data.update_available && !data.can_update) {
-                    btn.textContent = `Cooldown: ${data.cooldown_remaining}s`;
-                    btn.className = 'update-btn disabled';
-                    btn.disabled = true;
-                } else {
-                    btn.textContent = 'Up to Date';
-                    btn.className = 'update-btn disabled';
-                    btn.disabled = true;
-                }
-
-            } catch (error) {
-                console.error('Failed to check status:', error);
-                document.getElementById('current-version').textContent = 'Error';
-                document.getElementById('latest-version').textContent = 'Error';
-            } finally {
-                refreshBtn.disabled = false;
-                refreshBtn.textContent = 'Refresh Status';
-            }
-        }
+    <script src="{js_url}"></script>
+</body>
+</html>
+""".format(css_url=asset_url("dashboard.css"), js_url=asset_url("dashboard.js"))
 
-        async function performUpdate() {
-            if (updateInProgress) return;
+# Dashboard is static, so encode, compress and fingerprint it once
+_DASHBOARD_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_GZ = gzip.compress(_DASHBOARD_BYTES, 9)
+_DASHBOARD_ETAG = f'"{hashlib.md5(_DASHBOARD_BYTES).hexdigest()}"'
 
-            const btn = document.getElementById('update-btn');
-            const progressContainer = document.getElementById('progress-container');
-            const progressLog = document.getElementById('progress-log');
 
-            updateInProgress = true;
-            btn.textContent = 'Updating...';
-            btn.className = 'update-btn in-progress';
-            btn.disabled = true;
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Serve the dashboard HTML page."""
+    headers = {
+        "ETag": _DASHBOARD_ETAG,
+        "Cache-Control": "public, max-age=300",
+        "Vary": "Accept-Encoding"
+    }
 
-            progressContainer.classList.add('active');
-            progressLog.innerHTML = '';
+    if request.headers.get("if-none-match") == _DASHBOARD_ETAG:
+        return Response(status_code=304, headers=headers)
 
-            try {
-                const eventSource = new EventSource('/api/update/stream');
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=_DASHBOARD_GZ, media_type="text/html", headers=headers)
 
-                eventSource.onmessage = (event) => {
-                    const data = JSON.parse(event.data);
+    return Response(content=_DASHBOARD_BYTES, media_type="text/html", headers=headers)
 
-                    const line = document.createElement('div');
-                    line.className = 'line';
 
-                    if (data.type === 'error') {
-                        line.className = 'error';
-                    } else if (data.type === 'complete') {
-                        line.className = 'success';
-                    }
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
 
-                    line.textContent = data.message;
-                    progressLog.appendChild(line);
-                    progressLog.scrollTop = progressLog.scrollHeight;
 
-                    if (data.type === 'complete' || data.type === 'error') {
-                        eventSource.close();
-                        updateInProgress = false;
-                        setTimeout(checkStatus, 2000);
-                    }
-                };
+# Pre-encoded frames for constant SSE messages
+SSE_ALREADY_IN_PROGRESS = sse_event({"type": "error", "message": "Update already in progress"})
+SSE_UPDATE_COMPLETE = sse_event({"type": "complete", "message": "Update completed successfully!"})
+SSE_NOT_RUNNING = sse_event({"type": "error", "message": "No update in progress"})
 
-                eventSource.onerror = () => {
-                    eventSource.close();
-                    updateInProgress = false;
 
-                    const line = document.createElement('div');
-                    line.className = 'error';
-                    line.textContent = 'Connection lost. Please refresh status.';
-                    progressLog.appendChild(line);
+async def fetch_latest_version() -> Optional[str]:
+    """Get the latest version from GitHub, or None if unavailable."""
+    try:
+        release = await github_client.get_latest_release()
+        return release.get("tag_name", "").lstrip("v")
+    except Exception as e:
+        logger.error(f"Failed to fetch latest version: {e}")
+        return None
+
+
+async def build_status() -> StatusResponse:
+    """Collect the current version and container status.
+
+    Concurrent callers share a single computation, and the result is
+    reused for STATUS_CACHE_TTL seconds.
+    """
+    async with _status_lock:
+        if (_status_cache["data"] is not None
+                and time.monotonic() - _status_cache["ts"] < STATUS_CACHE_TTL):
+            return _status_cache["data"]
+
+        # Docker inspect and the GitHub fetch run concurrently
+        container, latest_version = await asyncio.gather(
+            asyncio.to_thread(get_docker_ops().get_container_info),
+            fetch_latest_version()
+        )
+        current_version = container["version"]
+        docker_ops = get_docker_ops()
+
+        # Check if update is available
+        update_available = False
+        if current_version and latest_version:
+            update_available = is_update_available(current_version, latest_version)
+
+        status = StatusResponse(
+            current_version=format_version(current_version),
+            latest_version=format_version(latest_version),
+            latest_stale=github_client.stale_since is not None,
+            update_available=update_available,
+            container_status=container["status"].capitalize(),
+            container_running=container["running"],
+            can_update=docker_ops.can_update() and not update_lock.locked(),
+            cooldown_remaining=docker_ops.get_cooldown_remaining(),
+            last_checked=datetime.now().strftime("%H:%M:%S")
+        )
+
+        _status_cache["data"] = status
+        _status_cache["ts"] = time.monotonic()
+        return status
 
-                    setTimeout(checkStatus, 2000);
-                };
 
-            } catch (error) {
-                console.error('Update failed:', error);
-                updateInProgress = false;
+@app.get("/api/status", response_model=StatusResponse)
+async def get_status():
+    """Get current version status."""
+    status = await build_status()
+    return JSONResponse(
+        content=status.model_dump(),
+        headers={"Cache-Control": "public, max-age=3, stale-while-revalidate=10"}
+    )
 
-                const line = document.createElement('div');
-                line.className = 'error';
-                line.textContent = 'Update failed: ' + error.message;
-                progressLog.appendChild(line);
 
-                checkStatus();
-            }
-        }
+@app.get("/api/status/stream")
+async def stream_status(request: Request):
+    """Push status changes via Server-Sent Events."""
 
-        // Set up event listeners
-        document.getElementById('update-btn').addEventListener('click', performUpdate);
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        last_payload = None
+        last_sent = time.monotonic()
 
-        // Initial status check
-        checkStatus();
+        while not await request.is_disconnected():
+            status = await build_status()
+            # last_checked changes on every poll, so ignore it when diffing
+            payload = status.model_dump(exclude={"last_checked"})
 
-        // Auto-refresh every 30 seconds when not updating
-        setInterval(() => {
-            if (!updateInProgress) {
-                checkStatus();
-            }
-        }, 30000);
-    </script>
-</body>
-</html>
-"""
+            if payload != last_payload:
+                last_payload = payload
+                last_sent = time.monotonic()
+                yield sse_event(status.model_dump())
+            elif time.monotonic() - last_sent >= STATUS_STREAM_KEEPALIVE:
+                last_sent = time.monotonic()
+                yield KEEPALIVE_FRAME
 
+            await asyncio.sleep(STATUS_STREAM_INTERVAL)
 
-@app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Serve the dashboard HTML page."""
-    return DASHBOARD_HTML
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
 
 
-@app.get("/api/status", response_model=StatusResponse)
-async def get_status():
-    """Get current version status."""
-    # Get current version from running container
-    current_version = docker_ops.get_running_version()
+async def run_update() -> Optional[str]:
+    """Run perform_update, publishing progress to the update event log.
+
+    Expects update_lock to be held by the caller and releases it when done.
+
+    Returns:
+        Error message if the update failed, otherwise None
+    """
+    logger.info("Starting update")
 
-    # Get latest version from GitHub
     try:
-        release = await github_client.get_latest_release()
-        latest_version = release.get("tag_name", "").lstrip("v")
+        # A hung command would otherwise hold update_lock until restart;
+        # on timeout the cancellation terminates its process group
+        async with asyncio.timeout(SETTINGS.update_timeout):
+            async for message in get_docker_ops().perform_update():
+                update_events.publish(sse_event({"type": "progress", "message": message}))
+
+        update_events.publish(SSE_UPDATE_COMPLETE, final=True)
+        return None
+
+    except TimeoutError:
+        message = f"Update timed out after {SETTINGS.update_timeout} seconds"
+        logger.error(message)
+        update_events.publish(sse_event({"type": "error", "message": message}), final=True)
+        return message
+
     except Exception as e:
-        logger.error(f"Failed to fetch latest version: {e}")
-        latest_version = None
-
-    # Get container status
-    container_status = docker_ops.get_container_status()
-
-    # Check if update is available
-    update_available = False
-    if current_version and latest_version:
-        update_available = is_update_available(current_version, latest_version)
-
-    return StatusResponse(
-        current_version=format_version(current_version),
-        latest_version=format_version(latest_version),
-        update_available=update_available,
-        container_status=container_status["status"].capitalize(),
-        container_running=container_status["running"],
-        can_update=docker_ops.can_update() and not update_in_progress,
-        cooldown_remaining=docker_ops.get_cooldown_remaining(),
-        last_checked=datetime.now().strftime("%H:%M:%S")
-    )
+        logger.error(f"Update failed: {e}")
+        update_events.publish(sse_event({"type": "error", "message": str(e)}), final=True)
+        return str(e)
+
+    finally:
+        update_lock.release()
+
+
+async def start_update() -> asyncio.Task:
+    """Acquire update_lock and start run_update in the background."""
+    global _update_task
+
+    # The lock is free, so this returns without suspending
+    await update_lock.acquire()
+    update_events.start()
+    _update_task = asyncio.create_task(run_update())
+    return _update_task
 
 
 @app.post("/api/update", response_model=UpdateResponse)
 async def trigger_update():
     """Trigger an update (non-streaming)."""
-    global update_in_progress
-
-    if update_in_progress:
+    if update_lock.locked():
         return UpdateResponse(success=False, message="Update already in progress")
 
+    docker_ops = get_docker_ops()
     if not docker_ops.can_update():
         remaining = docker_ops.get_cooldown_remaining()
         return UpdateResponse(success=False, message=f"Please wait {remaining} seconds")
 
-    update_in_progress = True
+    task = await start_update()
+    error = await asyncio.shield(task)
 
-    try:
-        for _ in docker_ops.perform_update():
-            pass
-        return UpdateResponse(success=True, message="Update completed successfully")
-    except Exception as e:
-        logger.error(f"Update failed: {e}")
-        return UpdateResponse(success=False, message=str(e))
-    finally:
-        update_in_progress = False
+    if error:
+        return UpdateResponse(success=False, message=error)
+    return UpdateResponse(success=True, message="Update completed successfully")
 
 
 @app.get("/api/update/stream")
-async def stream_update():
-    """Stream update progress via Server-Sent Events."""
-    global update_in_progress
-
-    async def event_generator() -> AsyncGenerator[str, None]:
-        global update_in_progress
+async def stream_update(request: Request):
+    """Stream update progress via Server-Sent Events.
+
+    A reconnecting client sends Last-Event-ID and resumes from the events it
+    missed instead of starting a new update.
+    """
+    last_event_id = request.headers.get("last-event-id")
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        if last_event_id is not None:
+            try:
+                resume_from = int(last_event_id)
+            except ValueError:
+                resume_from = 0
+
+            sent = False
+            async for frame in update_events.follow(resume_from, UPDATE_STREAM_KEEPALIVE):
+                sent = True
+                yield frame
+
+            if not sent:
+                # Nothing to resume; end the stream so the browser stops retrying
+                yield SSE_NOT_RUNNING
+            return
 
-        if update_in_progress:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Update already in progress'})}\n\n"
+        if update_lock.locked():
+            yield SSE_ALREADY_IN_PROGRESS
             return
 
+        docker_ops = get_docker_ops()
         if not docker_ops.can_update():
             remaining = docker_ops.get_cooldown_remaining()
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Cooldown active. Wait {remaining}s'})}\n\n"
+            yield sse_event({"type": "error", "message": f"Cooldown active. Wait {remaining}s"})
             return
 
-        update_in_progress = True
-        logger.info("Starting streamed update")
-
-        try:
-            for message in docker_ops.perform_update():
-                yield f"data: {json.dumps({'type': 'progress', 'message': message})}\n\n"
-                await asyncio.sleep(0.1)  # Allow event to be sent
-
-            yield f"data: {json.dumps({'type': 'complete', 'message': 'Update completed successfully!'})}\n\n"
+        start_id = update_events.last_id
+        await start_update()
 
-        except Exception as e:
-            logger.error(f"Update failed: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-
-        finally:
-            update_in_progress = False
-
-    # Need to import json for the generator
-    import json
+        async for frame in update_events.follow(start_id, UPDATE_STREAM_KEEPALIVE):
+            yield frame
 
     return StreamingResponse(
         event_generator(),
@@ -612,10 +412,18 @@ async def stream_update():
 @app.on_event("startup")
 async def startup_event():
     """Log startup information."""
-    settings = get_settings()
     logger.info("Companion Update Dashboard starting")
-    logger.info(f"Monitoring container: {settings.companion_container_name}")
-    logger.info(f"Companion path: {settings.companion_docker_path}")
+    logger.info(f"Monitoring container: {SETTINGS.companion_container_name}")
+    logger.info(f"Companion path: {SETTINGS.companion_docker_path}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared HTTP connections."""
+    await github_client.aclose()
+    # Only close Docker clients that were actually created
+    if get_docker_ops.cache_info().currsize:
+        await get_docker_ops().aclose()
 
 
 if __name__ == "__main__":
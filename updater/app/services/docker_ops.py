@@ -1,250 +1,633 @@
-import subprocess
-import json
+import asyncio
+import hashlib
 import logging
+import math
+import os
+import signal
+import httpx
+import orjson
+import threading
 import time
+from contextlib import aclosing
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Generator, Dict, Any
+from typing import Optional, AsyncGenerator, Dict, Any, List, Sequence, Tuple
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upstream image the Companion Dockerfile builds on
+COMPANION_BASE_IMAGE = "ghcr.io/bitfocus/companion/companion:latest"
+
+# Seconds to wait after SIGTERM before killing an abandoned command
+_TERMINATE_TIMEOUT = 10
+
+# Start-up polling after a restart: attempts and backoff cap in seconds
+_START_POLL_ATTEMPTS = 30
+_START_POLL_MAX_DELAY = 2.0
+
+# Commands run for each update step
+_BUILD_CMD = ("docker", "compose", "build", "--pull")
+_UP_CMD = ("docker", "compose", "up", "-d")
+_CONFIG_HASH_CMD = ("docker", "compose", "config", "--hash")
+
+# Labels compose puts on the containers it creates
+_SERVICE_LABEL = "com.docker.compose.service"
+_CONFIG_HASH_LABEL = "com.docker.compose.config-hash"
+
+# Subprocess output is buffered in-process up to this size before the pipe
+# is left to fill, and read from the pipe in chunks of _READ_CHUNK bytes
+_STREAM_LIMIT = 1 << 20
+_READ_CHUNK = 1 << 16
+
+# Seconds of silence after which a partial (unterminated) line is emitted
+_IDLE_FLUSH = 15
+
+
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncGenerator[bytes, None]:
+    """Yield lines from a subprocess stream, reading it in large chunks.
+
+    Output that has no trailing newline yet is flushed after _IDLE_FLUSH
+    seconds of silence, so progress written without newlines still shows.
+    """
+    pending = b""
+    while True:
+        try:
+            chunk = await asyncio.wait_for(stream.read(_READ_CHUNK), timeout=_IDLE_FLUSH)
+        except asyncio.TimeoutError:
+            if pending:
+                yield pending
+                pending = b""
+            continue
+
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            yield line
+
+    if pending:
+        yield pending
+
+
+async def _terminate_group(process: asyncio.subprocess.Process):
+    """Stop a process group with SIGTERM, escalating to SIGKILL on timeout."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), timeout=_TERMINATE_TIMEOUT)
+        except asyncio.TimeoutError:
+            os.killpg(process.pid, signal.SIGKILL)
+            await process.wait()
+    except ProcessLookupError:
+        pass
+
+
+def _status_entry(status: Optional[str]) -> Dict[str, Any]:
+    """Build a container status dict from its run state, None if missing."""
+    if status is None:
+        return {"exists": False, "status": "not found", "running": False}
+    return {"exists": True, "status": status, "running": status == "running"}
+
+
+def _error_status(error: Exception) -> Dict[str, Any]:
+    """Build the container status dict reported when the daemon call fails."""
+    return {"exists": False, "status": f"error: {error}", "running": False}
+
 
 class DockerOperations:
     """Handle Docker operations for Companion container management."""
 
     def __init__(self):
-        self.settings = get_settings()
-        self._last_update_time: float = 0
+        # Copy settings to plain attributes read on hot paths
+        settings = get_settings()
+        self._container_name = settings.companion_container_name
+        self._cooldown = settings.update_cooldown
+        self._companion_path = Path(settings.companion_docker_path).resolve()
+        if not self._companion_path.is_dir():
+            logger.warning(f"Companion directory not found: {self._companion_path}")
+        # Token bucket: update_burst tokens, one regained per update_cooldown
+        self._capacity = float(settings.update_burst)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        # The version label only changes after an update, so cache it briefly
+        self._version_cache: Tuple[float, Optional[str]] = (-math.inf, None)
+        self._version_ttl: float = 10
+        # One inspect result is shared by version and status lookups
+        self._inspect_cache: Tuple[float, Optional[Dict[str, Any]]] = (-math.inf, None)
+        self._inspect_ttl: float = 2
+        self._inspect_lock = threading.Lock()
+        # Serializes update runs regardless of which endpoint starts them
+        self._update_lock = asyncio.Lock()
+        # Build context hash of the image the running container was started
+        # from; unknown until this process has completed an update
+        self._deployed_context_hash: Optional[str] = None
+        # Keep-alive client for the Docker Engine API on the local socket
+        self._docker = httpx.Client(
+            transport=httpx.HTTPTransport(uds=settings.docker_socket),
+            base_url="http://docker",
+            timeout=10.0
+        )
+        # Async counterpart for long streaming calls such as image pulls
+        self._docker_async = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=settings.docker_socket),
+            base_url="http://docker",
+            timeout=10.0
+        )
+
+    def _refill(self):
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        if self._cooldown <= 0:
+            self._tokens = self._capacity
+        else:
+            earned = (now - self._last_refill) / self._cooldown
+            self._tokens = min(self._capacity, self._tokens + earned)
+        self._last_refill = now
+
+    def _spend_token(self):
+        """Consume one rate limit token for a finished update."""
+        self._refill()
+        self._tokens -= 1
 
     def can_update(self) -> bool:
-        """Check if enough time has passed since the last update."""
-        elapsed = time.time() - self._last_update_time
-        return elapsed >= self.settings.update_cooldown
+        """Check if the rate limit allows another update."""
+        self._refill()
+        return self._tokens >= 1
 
     def get_cooldown_remaining(self) -> int:
         """Get seconds remaining until next update allowed."""
-        elapsed = time.time() - self._last_update_time
-        remaining = self.settings.update_cooldown - elapsed
-        return max(0, int(remaining))
+        self._refill()
+        if self._tokens >= 1:
+            return 0
+        return math.ceil((1 - self._tokens) * self._cooldown)
+
+    def _inspect_container(self) -> Optional[Dict[str, Any]]:
+        """Inspect the Companion container through the Docker Engine API.
+
+        Concurrent callers share a single request, and the result is reused
+        for a couple of seconds.
+
+        Returns:
+            Container details as returned by the API, or None if not found
+
+        Raises:
+            httpx.HTTPError: If the Docker daemon request fails
+        """
+        with self._inspect_lock:
+            cached_at, cached_info = self._inspect_cache
+            if time.monotonic() - cached_at < self._inspect_ttl:
+                return cached_info
+
+            response = self._docker.get(f"/containers/{self._container_name}/json")
+
+            if response.status_code == 404:
+                info = None
+            else:
+                response.raise_for_status()
+                info = orjson.loads(response.content)
+
+            self._inspect_cache = (time.monotonic(), info)
+            return info
+
+    def _invalidate_cache(self):
+        """Drop cached inspect data so the next lookup hits the daemon."""
+        self._inspect_cache = (-math.inf, None)
+        self._version_cache = (-math.inf, None)
 
     def get_running_version(self) -> Optional[str]:
         """Get the version of the running Companion container.
 
-        Reads the version from the container's image labels.
+        Reads the version from the container's image labels. The result is
+        cached for a few seconds and invalidated after an update.
 
         Returns:
             Version string like "4.2.3" or None if not found
         """
-        container_name = self.settings.companion_container_name
+        cached_at, cached_version = self._version_cache
+        if time.monotonic() - cached_at < self._version_ttl:
+            return cached_version
 
-        try:
-            # Get version from container image labels
-            result = subprocess.run(
-                [
-                    "docker", "inspect", "--format",
-                    '{{index .Config.Labels "org.opencontainers.image.version"}}',
-                    container_name
-                ],
-                capture_output=True,
-                text=True
-            )
+        version = self._read_running_version()
+        self._version_cache = (time.monotonic(), version)
+        return version
 
-            if result.returncode != 0:
-                logger.error(f"Container {container_name} not found")
-                return None
-
-            version = result.stdout.strip()
-            if version and version != "<no value>":
-                # Remove 'v' prefix if present for consistency
-                version = version.lstrip("v")
-                logger.info(f"Current Companion version: {version}")
-                return version
+    def _read_running_version(self) -> Optional[str]:
+        """Read the version label from the container without caching."""
+        try:
+            info = self._inspect_container()
+        except httpx.HTTPError as e:
+            logger.error(f"Docker API error: {e}")
+            return None
 
-            logger.warning("Version label not found in container")
+        if info is None:
+            logger.error(f"Container {self._container_name} not found")
             return None
 
-        except subprocess.SubprocessError as e:
-            logger.error(f"Subprocess error: {e}")
+        labels = (info.get("Config") or {}).get("Labels") or {}
+        version = labels.get("org.opencontainers.image.version")
+        if version:
+            # Remove 'v' prefix if present for consistency
+            version = version.lstrip("v")
+            logger.info(f"Current Companion version: {version}")
+            return version
 
+        logger.warning("Version label not found in container")
         return None
 
     def get_container_status(self) -> Dict[str, Any]:
         """Get the current status of the Companion container."""
-        container_name = self.settings.companion_container_name
+        return self.get_container_statuses([self._container_name])[self._container_name]
 
-        try:
-            result = subprocess.run(
-                ["docker", "inspect", "--format", "{{.State.Status}}", container_name],
-                capture_output=True,
-                text=True
-            )
+    def get_container_statuses(self, names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the status of several containers with a single Docker API call.
 
-            if result.returncode != 0:
-                return {
-                    "exists": False,
-                    "status": "not found",
-                    "running": False
-                }
-
-            status = result.stdout.strip()
-            return {
-                "exists": True,
-                "status": status,
-                "running": status == "running"
-            }
-
-        except subprocess.SubprocessError as e:
-            return {
-                "exists": False,
-                "status": f"error: {e}",
-                "running": False
-            }
-
-    def pull_base_image(self) -> Generator[str, None, None]:
-        """Pull the latest Companion base image.
+        Args:
+            names: Container names to look up
 
-        Yields:
-            Progress messages
+        Returns:
+            Dict mapping each name to the same shape as get_container_status()
         """
-        yield "Pulling latest Companion base image..."
+        filters = orjson.dumps({"name": list(names)}).decode()
 
         try:
-            # Pull the image using Docker CLI for better progress output
-            process = subprocess.Popen(
-                ["docker", "pull", "ghcr.io/bitfocus/companion/companion:latest"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True
+            response = self._docker.get(
+                "/containers/json", params={"all": "true", "filters": filters}
             )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return {name: _error_status(e) for name in names}
+
+        # The name filter matches substrings, so pick out exact names here
+        states: Dict[str, str] = {}
+        for container in orjson.loads(response.content):
+            for container_name in container["Names"]:
+                states[container_name.lstrip("/")] = container["State"]
+
+        return {name: _status_entry(states.get(name)) for name in names}
+
+    def _image_layers(self, image: str) -> Optional[List[str]]:
+        """Get the root filesystem layer digests of a local image."""
+        response = self._docker.get(f"/images/{image}/json")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return orjson.loads(response.content)["RootFS"]["Layers"]
 
-            for line in iter(process.stdout.readline, ""):
-                line = line.strip()
-                if line:
-                    yield f"  {line}"
+    def is_built_on_latest_base(self) -> bool:
+        """Check if the running container's image already contains the pulled base.
 
-            process.wait()
+        The container runs a custom image built FROM the base, so its image
+        id never equals the base id; instead the base layers must be a prefix
+        of the container image layers.
 
-            if process.returncode != 0:
-                raise RuntimeError("Failed to pull base image")
+        Returns:
+            True if rebuilding would not pick up a newer base image
+        """
+        try:
+            info = self._inspect_container()
+            if info is None:
+                return False
+
+            base_layers = self._image_layers(COMPANION_BASE_IMAGE)
+            current_layers = self._image_layers(info["Image"])
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not compare image layers: {e}")
+            return False
+
+        if not base_layers or current_layers is None:
+            return False
+        return current_layers[:len(base_layers)] == base_layers
+
+    def _build_context_hash(self) -> str:
+        """Hash the paths and contents of every file in the Companion directory."""
+        digest = hashlib.sha256()
+        for path in sorted(p for p in self._companion_path.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(self._companion_path).as_posix().encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    async def _compose_config_hash(self, service: str) -> Optional[str]:
+        """Get the config hash compose would give a container created now."""
+        try:
+            async with aclosing(self._stream_subprocess(
+                _CONFIG_HASH_CMD + (service,),
+                cwd=self._companion_path,
+                error_msg="Failed to compute compose config hash"
+            )) as lines:
+                output = [line async for line in lines]
+        except RuntimeError as e:
+            logger.warning(str(e))
+            return None
 
-            yield "Base image pulled successfully"
+        for line in output:
+            name, _, config_hash = line.strip().partition(" ")
+            if name == service and config_hash:
+                return config_hash.strip()
+        return None
 
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to pull image: {e}")
-            raise RuntimeError(f"Failed to pull image: {e}")
+    async def _is_deployment_current(self, context_hash: str) -> bool:
+        """Check if rebuilding and recreating the container would change nothing.
 
-    def rebuild_image(self) -> Generator[str, None, None]:
-        """Rebuild the Companion image with docker compose.
+        That requires the running image to contain the pulled base, the build
+        context to match the one last deployed, and the container's compose
+        config hash to match the current compose configuration.
 
-        Yields:
-            Progress messages
+        Args:
+            context_hash: Current hash of the build context
+
+        Returns:
+            True only if every check passes
         """
-        yield "Rebuilding Companion image..."
+        if context_hash != self._deployed_context_hash:
+            return False
+        if not await asyncio.to_thread(self.is_built_on_latest_base):
+            return False
 
-        companion_path = Path(self.settings.companion_docker_path)
+        try:
+            info = await asyncio.to_thread(self._inspect_container)
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not read container labels: {e}")
+            return False
+        if info is None:
+            return False
 
-        if not companion_path.exists():
-            raise RuntimeError(f"Companion directory not found: {companion_path}")
+        labels = (info.get("Config") or {}).get("Labels") or {}
+        running_hash = labels.get(_CONFIG_HASH_LABEL)
+        if not running_hash:
+            return False
 
-        try:
-            process = subprocess.Popen(
-                ["docker", "compose", "build", "--no-cache"],
-                cwd=str(companion_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True
-            )
+        service = labels.get(_SERVICE_LABEL, self._container_name)
+        return await self._compose_config_hash(service) == running_hash
 
-            for line in iter(process.stdout.readline, ""):
-                line = line.strip()
-                if line:
-                    yield f"  {line}"
+    def _startup_state(self) -> str:
+        """Get the container's health status from a fresh inspect.
 
-            process.wait()
+        Returns:
+            "healthy"/"starting"/"unhealthy" from the healthcheck, "running"
+            if there is no healthcheck, or the run state if not running
+        """
+        self._invalidate_cache()
+        try:
+            info = self._inspect_container()
+        except httpx.HTTPError as e:
+            return f"error: {e}"
 
-            if process.returncode != 0:
-                raise RuntimeError("Failed to rebuild image")
+        if info is None:
+            return "not found"
 
-            yield "Image rebuilt successfully"
+        state = info["State"]
+        if state["Status"] != "running":
+            return state["Status"]
 
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to rebuild image: {e}")
-            raise RuntimeError(f"Failed to rebuild image: {e}")
+        health = state.get("Health")
+        return health["Status"] if health else "running"
 
-    def restart_container(self) -> Generator[str, None, None]:
-        """Restart the Companion container with docker compose.
+    async def _wait_for_start(self) -> AsyncGenerator[str, None]:
+        """Poll the container with backoff until it is running and healthy.
 
         Yields:
-            Progress messages
+            Progress messages when the observed state changes
         """
-        yield "Restarting Companion container..."
+        last_state = None
+        for attempt in range(_START_POLL_ATTEMPTS):
+            state = await asyncio.to_thread(self._startup_state)
+            if state in ("healthy", "running"):
+                yield f"Companion is {state}"
+                return
+
+            if state != last_state:
+                yield f"  waiting... ({state})"
+                last_state = state
 
-        companion_path = Path(self.settings.companion_docker_path)
+            await asyncio.sleep(min(0.2 * 2 ** attempt, _START_POLL_MAX_DELAY))
 
+        yield "Companion did not report healthy in time"
+
+    def get_container_info(self) -> Dict[str, Any]:
+        """Get the running version and container status from one inspect.
+
+        Returns:
+            Dict with version, exists, status and running keys
+        """
+        # Reuses the cached inspect that get_running_version reads
         try:
-            process = subprocess.Popen(
-                ["docker", "compose", "up", "-d"],
-                cwd=str(companion_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True
+            info = self._inspect_container()
+        except httpx.HTTPError as e:
+            status = _error_status(e)
+        else:
+            status = _status_entry(info["State"]["Status"] if info else None)
+
+        return {"version": self.get_running_version(), **status}
+
+    async def _stream_subprocess(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: Optional[Path] = None,
+        error_msg: str
+    ) -> AsyncGenerator[str, None]:
+        """Run a command and yield its non-empty output lines.
+
+        Args:
+            cmd: Command and arguments to execute
+            cwd: Working directory for the command
+            error_msg: Message for the RuntimeError raised on failure
+
+        Yields:
+            Indented output lines
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=_STREAM_LIMIT,
+                # Own process group, so the whole tree can be signalled
+                start_new_session=True
             )
+        except OSError as e:
+            logger.error(f"{error_msg}: {e}")
+            raise RuntimeError(f"{error_msg}: {e}")
 
-            for line in iter(process.stdout.readline, ""):
-                line = line.strip()
+        try:
+            async for raw in _iter_lines(process.stdout):
+                line = raw.strip()
                 if line:
-                    yield f"  {line}"
+                    yield "  " + line.decode("utf-8", "replace")
 
-            process.wait()
+            await process.wait()
+        finally:
+            # Closed or cancelled mid-stream: don't leave the command running
+            if process.returncode is None:
+                logger.warning(f"Terminating unfinished command: {' '.join(cmd)}")
+                await _terminate_group(process)
 
-            if process.returncode != 0:
-                raise RuntimeError("Failed to restart container")
+        if process.returncode != 0:
+            raise RuntimeError(error_msg)
 
-            yield "Container restarted successfully"
+    async def pull_base_image(self) -> AsyncGenerator[str, None]:
+        """Pull the latest Companion base image.
 
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to restart container: {e}")
-            raise RuntimeError(f"Failed to restart container: {e}")
+        Uses the Engine API's NDJSON event stream and only reports a layer
+        when its status changes, skipping byte-level progress updates.
 
-    def perform_update(self) -> Generator[str, None, None]:
-        """Perform a full update of the Companion container.
+        Yields:
+            Progress messages
+        """
+        yield "Pulling latest Companion base image..."
+
+        image, tag = COMPANION_BASE_IMAGE.rsplit(":", 1)
+        layer_status: Dict[str, str] = {}
+
+        try:
+            async with self._docker_async.stream(
+                "POST",
+                "/images/create",
+                params={"fromImage": image, "tag": tag},
+                timeout=None
+            ) as response:
+                response.raise_for_status()
+
+                async for raw in response.aiter_lines():
+                    if not raw:
+                        continue
+
+                    event = orjson.loads(raw)
+                    if "error" in event:
+                        raise RuntimeError(f"Failed to pull base image: {event['error']}")
+
+                    status = event.get("status", "")
+                    layer = event.get("id")
+                    if layer:
+                        if layer_status.get(layer) == status:
+                            continue
+                        layer_status[layer] = status
+                        yield f"  {layer}: {status}"
+                    elif status:
+                        yield f"  {status}"
+
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to pull base image: {e}")
+            raise RuntimeError(f"Failed to pull base image: {e}")
+
+        yield "Base image pulled successfully"
+
+    async def rebuild_image(self, no_cache: bool = False) -> AsyncGenerator[str, None]:
+        """Rebuild the Companion image with docker compose.
+
+        The layer cache is kept by default so only steps after a changed base
+        image are rebuilt.
+
+        Args:
+            no_cache: Rebuild every layer from scratch
 
         Yields:
-            Progress messages for each step
+            Progress messages
         """
-        if not self.can_update():
-            remaining = self.get_cooldown_remaining()
-            raise RuntimeError(f"Update cooldown active. Please wait {remaining} seconds.")
+        yield "Rebuilding Companion image..."
 
-        logger.info("Starting Companion update process")
-        yield "Starting update process..."
+        if not self._companion_path.is_dir():
+            raise RuntimeError(f"Companion directory not found: {self._companion_path}")
 
-        # Pull latest base image
-        yield from self.pull_base_image()
+        cmd = _BUILD_CMD + ("--no-cache",) if no_cache else _BUILD_CMD
+        # aclosing() reaps the command as soon as this generator is closed
+        async with aclosing(self._stream_subprocess(
+            cmd, cwd=self._companion_path, error_msg="Failed to rebuild image"
+        )) as lines:
+            async for line in lines:
+                yield line
 
-        # Rebuild the image
-        yield from self.rebuild_image()
+        yield "Image rebuilt successfully"
 
-        # Restart the container
-        yield from self.restart_container()
+    async def restart_container(self) -> AsyncGenerator[str, None]:
+        """Restart the Companion container with docker compose.
 
-        # Update cooldown timer
-        self._last_update_time = time.time()
+        Yields:
+            Progress messages
+        """
+        yield "Restarting Companion container..."
 
-        # Wait a moment for container to start
-        yield "Waiting for Companion to start..."
-        time.sleep(5)
+        async with aclosing(self._stream_subprocess(
+            _UP_CMD, cwd=self._companion_path, error_msg="Failed to restart container"
+        )) as lines:
+            async for line in lines:
+                yield line
 
-        # Verify the new version
-        new_version = self.get_running_version()
-        if new_version:
-            yield f"Update complete! Now running version {new_version}"
-        else:
-            yield "Update complete! Could not verify new version."
+        yield "Container restarted successfully"
 
-        logger.info("Companion update completed")
+    async def perform_update(self) -> AsyncGenerator[str, None]:
+        """Perform a full update of the Companion container.
 
+        Only one update runs at a time; a concurrent call fails immediately.
 
-# Singleton instance
-docker_ops = DockerOperations()
+        Yields:
+            Progress messages for each step
+        """
+        if self._update_lock.locked():
+            raise RuntimeError("Update already in progress")
+
+        async with self._update_lock:
+            if not self.can_update():
+                remaining = self.get_cooldown_remaining()
+                raise RuntimeError(f"Update cooldown active. Please wait {remaining} seconds.")
+
+            logger.info("Starting Companion update process")
+            yield "Starting update process..."
+
+            # Pull latest base image
+            async with aclosing(self.pull_base_image()) as messages:
+                async for message in messages:
+                    yield message
+
+            # Nothing to rebuild if the running container matches the pulled
+            # base and the local Dockerfile and compose configuration
+            context_hash = await asyncio.to_thread(self._build_context_hash)
+            if await self._is_deployment_current(context_hash):
+                self._spend_token()
+                yield "No new image - skipping rebuild"
+                yield "Update complete! Companion is already on the latest base image."
+                logger.info("Companion already up to date, update skipped")
+                return
+
+            # Rebuild the image
+            async with aclosing(self.rebuild_image()) as messages:
+                async for message in messages:
+                    yield message
+
+            # Restart the container
+            async with aclosing(self.restart_container()) as messages:
+                async for message in messages:
+                    yield message
+
+            self._deployed_context_hash = context_hash
+            self._spend_token()
+
+            # Wait for the container to come up
+            yield "Waiting for Companion to start..."
+            async with aclosing(self._wait_for_start()) as messages:
+                async for message in messages:
+                    yield message
+
+            # Verify the new version
+            self._invalidate_cache()
+            new_version = await asyncio.to_thread(self.get_running_version)
+            if new_version:
+                yield f"Update complete! Now running version {new_version}"
+            else:
+                yield "Update complete! Could not verify new version."
+
+            logger.info("Companion update completed")
+
+    async def aclose(self):
+        """Close the Docker API clients."""
+        self._docker.close()
+        await self._docker_async.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_docker_ops() -> DockerOperations:
+    """Get the shared DockerOperations instance, creating it on first use."""
+    return DockerOperations()
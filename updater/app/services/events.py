@@ -0,0 +1,76 @@
+import asyncio
+from collections import deque
+from typing import AsyncGenerator, Deque, Tuple
+
+# Comment frame sent to idle followers so proxies keep the connection open
+KEEPALIVE_FRAME = b": ping\n\n"
+
+
+class UpdateEventLog:
+    """Buffer of recent update progress events.
+
+    Each event is stored as an SSE frame tagged with an increasing id, so a
+    client that reconnects with Last-Event-ID can replay what it missed and
+    keep following the running update.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._events: Deque[Tuple[int, bytes, bool]] = deque(maxlen=maxlen)
+        self._last_id = 0
+        self._active = False
+        self._new_event = asyncio.Event()
+
+    @property
+    def last_id(self) -> int:
+        """Id of the most recently published event."""
+        return self._last_id
+
+    @property
+    def active(self) -> bool:
+        """Whether an update is currently publishing events."""
+        return self._active
+
+    def start(self):
+        """Mark the beginning of an update run."""
+        self._active = True
+
+    def publish(self, frame: bytes, final: bool = False):
+        """Append an SSE data frame, ending the run if final is set."""
+        self._last_id += 1
+        self._events.append((self._last_id, f"id: {self._last_id}\n".encode() + frame, final))
+        if final:
+            self._active = False
+
+        # Wake current followers and arm a fresh event for the next publish
+        self._new_event.set()
+        self._new_event = asyncio.Event()
+
+    async def follow(self, last_id: int, keepalive: float) -> AsyncGenerator[bytes, None]:
+        """Yield frames published after last_id until the run ends.
+
+        Args:
+            last_id: Id of the last event the client has already seen
+            keepalive: Seconds of silence before a keep-alive comment is sent
+        """
+        while True:
+            waiter = self._new_event
+
+            for event_id, frame, final in list(self._events):
+                if event_id <= last_id:
+                    continue
+                last_id = event_id
+                yield frame
+                if final:
+                    return
+
+            if not self._active:
+                return
+
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE_FRAME
+
+
+# Singleton instance
+update_events = UpdateEventLog()
@@ -1,9 +1,10 @@
+import asyncio
 import httpx
 import time
 import logging
 from typing import Optional, Dict, Any
 
-from ..config import get_settings
+from ..config import SETTINGS
 
 logger = logging.getLogger(__name__)
 
@@ -12,20 +13,51 @@ class GitHubClient:
     """Client for GitHub API to fetch release information."""
 
     def __init__(self):
-        self.settings = get_settings()
+        self.settings = SETTINGS
         self._cache: Optional[Dict[str, Any]] = None
         self._cache_time: float = 0
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._stale_since: Optional[float] = None
+        # Only one coroutine fetches at a time; the rest reuse its result
+        self._fetch_lock = asyncio.Lock()
+        # Long-lived client so connections to the API are reused between polls
+        self._client = httpx.AsyncClient(
+            base_url=self.settings.github_api_base,
+            headers={"Accept": "application/vnd.github.v3+json"},
+            http2=True,
+            timeout=10.0
+        )
 
     def _is_cache_valid(self) -> bool:
         """Check if the cached data is still valid."""
         if self._cache is None:
             return False
-        return (time.time() - self._cache_time) < self.settings.github_cache_ttl
+        return (time.monotonic() - self._cache_time) < self.settings.github_cache_ttl
+
+    @property
+    def stale_since(self) -> Optional[float]:
+        """Time the cached release started being served after a failed fetch."""
+        return self._stale_since
+
+    def _request_headers(self) -> Dict[str, str]:
+        """Build request headers, including conditional validators if cached."""
+        headers: Dict[str, str] = {}
+        if self.settings.github_token:
+            headers["Authorization"] = f"Bearer {self.settings.github_token}"
+        if self._cache is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        return headers
 
     async def get_latest_release(self) -> Dict[str, Any]:
         """Fetch the latest release from GitHub API.
 
-        Returns cached data if available and not expired.
+        Returns cached data if available and not expired. Once expired, a
+        conditional request is sent so an unchanged release costs a 304.
+        If GitHub is unreachable, the last known release is served instead.
 
         Returns:
             Dict with release information including:
@@ -38,41 +70,77 @@ class GitHubClient:
             logger.debug("Returning cached GitHub release data")
             return self._cache
 
-        url = f"{self.settings.github_api_base}/repos/{self.settings.github_repo}/releases/latest"
+        async with self._fetch_lock:
+            # Another coroutine may have refreshed the cache while we waited
+            if self._is_cache_valid():
+                return self._cache
+            return await self._fetch_latest_release()
+
+    async def _fetch_latest_release(self) -> Dict[str, Any]:
+        """Request the latest release from GitHub and update the cache."""
+        url = f"/repos/{self.settings.github_repo}/releases/latest"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers={"Accept": "application/vnd.github.v3+json"},
-                    timeout=10.0
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                self._cache = {
-                    "tag_name": data.get("tag_name", ""),
-                    "name": data.get("name", ""),
-                    "published_at": data.get("published_at", ""),
-                    "html_url": data.get("html_url", ""),
-                    "body": data.get("body", "")[:500]  # Truncate release notes
-                }
-                self._cache_time = time.time()
-
-                logger.info(f"Fetched latest release: {self._cache['tag_name']}")
+            response = await self._client.get(url, headers=self._request_headers())
+
+            if response.status_code == 304 and self._cache is not None:
+                logger.debug("GitHub release not modified, refreshing cache")
+                self._cache_time = time.monotonic()
+                self._stale_since = None
                 return self._cache
 
+            response.raise_for_status()
+
+            data = response.json()
+            self._cache = {
+                "tag_name": data.get("tag_name", ""),
+                "name": data.get("name", ""),
+                "published_at": data.get("published_at", ""),
+                "html_url": data.get("html_url", ""),
+                "body": data.get("body", "")[:500]  # Truncate release notes
+            }
+            self._cache_time = time.monotonic()
+            self._etag = response.headers.get("etag")
+            self._last_modified = response.headers.get("last-modified")
+            self._stale_since = None
+
+            logger.info(f"Fetched latest release: {self._cache['tag_name']}")
+            return self._cache
+
         except httpx.HTTPStatusError as e:
             logger.error(f"GitHub API HTTP error: {e.response.status_code}")
+            if self._cache is not None:
+                return self._serve_stale()
             raise RuntimeError(f"GitHub API error: {e.response.status_code}")
         except httpx.RequestError as e:
             logger.error(f"GitHub API request error: {e}")
+            if self._cache is not None:
+                return self._serve_stale()
             raise RuntimeError(f"Failed to connect to GitHub: {e}")
 
+    def _serve_stale(self) -> Dict[str, Any]:
+        """Return the last known release after a failed fetch.
+
+        The cache timestamp is refreshed so GitHub is retried at TTL pace
+        instead of on every status poll while it is unreachable.
+        """
+        logger.warning("Serving stale GitHub cache")
+        if self._stale_since is None:
+            self._stale_since = time.time()
+        self._cache_time = time.monotonic()
+        return self._cache
+
     def clear_cache(self):
         """Clear the cached release data."""
         self._cache = None
         self._cache_time = 0
+        self._etag = None
+        self._last_modified = None
+        self._stale_since = None
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
 
 
 # Singleton instance
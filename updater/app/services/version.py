@@ -1,7 +1,12 @@
 import re
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Tuple, Optional
 
+_VERSION_RE = re.compile(r"\d+")
 
+
+@lru_cache(maxsize=256)
 def parse_version(version_str: str) -> Tuple[int, ...]:
     """Parse a version string into a tuple of integers for comparison.
 
@@ -12,10 +17,10 @@ def parse_version(version_str: str) -> Tuple[int, ...]:
         Tuple of integers like (4, 2, 3)
     """
     # Remove 'v' prefix if present
-    version_str = version_str.lstrip("v")
+    version_str = version_str.removeprefix("v")
 
     # Extract numeric parts
-    parts = re.findall(r"\d+", version_str)
+    parts = _VERSION_RE.findall(version_str)
     return tuple(int(p) for p in parts)
 
 
@@ -31,18 +36,10 @@ def compare_versions(current: str, latest: str) -> int:
          0 if current == latest (up to date)
          1 if current > latest (ahead of release)
     """
-    current_parts = parse_version(current)
-    latest_parts = parse_version(latest)
-
-    # Pad shorter tuple with zeros
-    max_len = max(len(current_parts), len(latest_parts))
-    current_padded = current_parts + (0,) * (max_len - len(current_parts))
-    latest_padded = latest_parts + (0,) * (max_len - len(latest_parts))
-
-    if current_padded < latest_padded:
-        return -1
-    elif current_padded > latest_padded:
-        return 1
+    # Missing trailing parts count as zero; stop at the first difference
+    for a, b in zip_longest(parse_version(current), parse_version(latest), fillvalue=0):
+        if a != b:
+            return -1 if a < b else 1
     return 0
 
 
@@ -56,9 +53,16 @@ def is_update_available(current: str, latest: str) -> bool:
     Returns:
         True if latest > current
     """
+    current_parts = parse_version(current)
+    latest_parts = parse_version(latest)
+
+    # Equal-length tuples compare directly without padding
+    if len(current_parts) == len(latest_parts):
+        return current_parts < latest_parts
     return compare_versions(current, latest) < 0
 
 
+@lru_cache(maxsize=64)
 def format_version(version: Optional[str]) -> str:
     """Format a version string for display.
 
@@ -0,0 +1,177 @@
+let updateInProgress = false;
+
+// Keep the progress log bounded and batch DOM writes per animation frame
+const MAX_LOG_LINES = 500;
+let pendingLines = [];
+let flushScheduled = false;
+
+function flushLogLines() {
+    const progressLog = document.getElementById('progress-log');
+    const frag = document.createDocumentFragment();
+    for (const line of pendingLines) {
+        frag.appendChild(line);
+    }
+    pendingLines = [];
+    flushScheduled = false;
+
+    progressLog.appendChild(frag);
+    while (progressLog.childElementCount > MAX_LOG_LINES) {
+        progressLog.removeChild(progressLog.firstChild);
+    }
+    progressLog.scrollTop = progressLog.scrollHeight;
+}
+
+function appendLogLine(className, message) {
+    const line = document.createElement('div');
+    line.className = className;
+    line.textContent = message;
+    pendingLines.push(line);
+
+    if (!flushScheduled) {
+        flushScheduled = true;
+        requestAnimationFrame(flushLogLines);
+    }
+}
+
+function updateUI(data) {
+    const btn = document.getElementById('update-btn');
+
+    // Update version displays
+    document.getElementById('current-version').textContent = data.current_version;
+
+    const latestEl = document.getElementById('latest-version');
+    latestEl.textContent = data.latest_version;
+    latestEl.className = 'version-number ' + (data.update_available ? 'latest' : 'up-to-date');
+    latestEl.title = data.latest_stale ? 'GitHub unreachable, showing cached release' : '';
+
+    // Update container status
+    const containerStatus = document.getElementById('container-status');
+    containerStatus.textContent = data.container_status;
+    containerStatus.className = 'status-badge ' + (data.container_running ? 'badge-running' : 'badge-stopped');
+
+    // Update update status
+    const updateStatus = document.getElementById('update-status');
+    if (data.update_available) {
+        updateStatus.textContent = 'Update Available';
+        updateStatus.className = 'status-badge badge-update';
+    } else {
+        updateStatus.textContent = 'Up to Date';
+        updateStatus.className = 'status-badge badge-current';
+    }
+
+    // Update last checked
+    document.getElementById('last-checked').textContent = data.last_checked;
+
+    // Update button state
+    if (data.update_available && data.can_update) {
+        btn.textContent = 'Update Now';
+        btn.className = 'update-btn available';
+        btn.disabled = false;
+    } else if (data.update_available && !data.can_update) {
+        btn.textContent = `Cooldown: ${data.cooldown_remaining}s`;
+        btn.className = 'update-btn disabled';
+        btn.disabled = true;
+    } else {
+        btn.textContent = 'Up to Date';
+        btn.className = 'update-btn disabled';
+        btn.disabled = true;
+    }
+}
+
+async function checkStatus() {
+    const refreshBtn = document.getElementById('refresh-btn');
+
+    if (updateInProgress) return;
+
+    refreshBtn.disabled = true;
+    refreshBtn.textContent = 'Checking...';
+
+    try {
+        const response = await fetch('/api/status', {cache: 'no-cache'});
+        updateUI(await response.json());
+    } catch (error) {
+        console.error('Failed to check status:', error);
+        document.getElementById('current-version').textContent = 'Error';
+        document.getElementById('latest-version').textContent = 'Error';
+    } finally {
+        refreshBtn.disabled = false;
+        refreshBtn.textContent = 'Refresh Status';
+    }
+}
+
+async function performUpdate() {
+    if (updateInProgress) return;
+
+    const btn = document.getElementById('update-btn');
+    const progressContainer = document.getElementById('progress-container');
+    const progressLog = document.getElementById('progress-log');
+
+    updateInProgress = true;
+    btn.textContent = 'Updating...';
+    btn.className = 'update-btn in-progress';
+    btn.disabled = true;
+
+    progressContainer.classList.add('active');
+    progressLog.innerHTML = '';
+    pendingLines = [];
+
+    try {
+        const eventSource = new EventSource('/api/update/stream');
+
+        eventSource.onmessage = (event) => {
+            const data = JSON.parse(event.data);
+
+            let className = 'line';
+            if (data.type === 'error') {
+                className = 'error';
+            } else if (data.type === 'complete') {
+                className = 'success';
+            }
+
+            appendLogLine(className, data.message);
+
+            if (data.type === 'complete' || data.type === 'error') {
+                eventSource.close();
+                updateInProgress = false;
+                setTimeout(checkStatus, 2000);
+            }
+        };
+
+        eventSource.onerror = () => {
+            if (eventSource.readyState === EventSource.CONNECTING) {
+                // Browser retries with Last-Event-ID and the server resumes the log
+                appendLogLine('error', 'Connection lost. Reconnecting...');
+                return;
+            }
+
+            eventSource.close();
+            updateInProgress = false;
+
+            appendLogLine('error', 'Connection lost. Please refresh status.');
+
+            setTimeout(checkStatus, 2000);
+        };
+
+    } catch (error) {
+        console.error('Update failed:', error);
+        updateInProgress = false;
+
+        appendLogLine('error', 'Update failed: ' + error.message);
+
+        checkStatus();
+    }
+}
+
+// Set up event listeners
+document.getElementById('update-btn').addEventListener('click', performUpdate);
+
+// Initial status check
+checkStatus();
+
+// Receive status changes pushed by the server
+const statusSource = new EventSource('/api/status/stream');
+statusSource.onmessage = (event) => {
+    if (!updateInProgress) {
+        updateUI(JSON.parse(event.data));
+    }
+};